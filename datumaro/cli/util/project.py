@@ -15,6 +15,17 @@ from datumaro.util.os_util import generate_next_name
 from datumaro.util.scope import on_error_do, scoped
 
 
+_DATASET_PATHSPEC_RE = re.compile(r"""
+    (?P<dataset_path>(?: [^:] | :[/\\] )+)
+    (:(?P<format>.+))?
+    """, flags=re.VERBOSE)
+
+_REVSPEC_RE = re.compile(r"""
+    (?P<proj_path>(?: [^@:] | :[/\\] )+)
+    (@(?P<rev>[^:]+))?
+    (:(?P<source>.+))?
+    """, flags=re.VERBOSE)
+
 def load_project(project_dir, readonly=False):
     return Project(project_dir, readonly=readonly)
 
@@ -37,10 +48,7 @@ def parse_dataset_pathspec(s: str,
     Returns: a dataset from the parsed path
     """
 
-    match = re.fullmatch(r"""
-        (?P<dataset_path>(?: [^:] | :[/\\] )+)
-        (:(?P<format>.+))?
-        """, s, flags=re.VERBOSE)
+    match = _DATASET_PATHSPEC_RE.fullmatch(s)
     if not match:
         raise ValueError("Failed to recognize dataset pathspec in '%s'" % s)
     match = match.groupdict()
@@ -63,11 +71,7 @@ def parse_revspec(s: str, ctx_project: Optional[Project] = None) \
       The project is only returned when specified in the revpath.
     """
 
-    match = re.fullmatch(r"""
-        (?P<proj_path>(?: [^@:] | :[/\\] )+)
-        (@(?P<rev>[^:]+))?
-        (:(?P<source>.+))?
-        """, s, flags=re.VERBOSE)
+    match = _REVSPEC_RE.fullmatch(s)
     if not match:
         raise ValueError("Failed to recognize revspec in '%s'" % s)
     match = match.groupdict()
@@ -62,7 +62,8 @@ class CliPlugin:
         args = parser.parse_args(args)
         args = vars(args)
 
-        log.debug("Parsed parameters: \n\t%s",
-            '\n\t'.join('%s: %s' % (k, v) for k, v in args.items()))
+        if log.getLogger().isEnabledFor(log.DEBUG):
+            log.debug("Parsed parameters: \n\t%s",
+                '\n\t'.join('%s: %s' % (k, v) for k, v in args.items()))
 
         return args
@@ -3,14 +3,23 @@
 # SPDX-License-Identifier: MIT
 
 from typing import IO, Union
+import weakref
 
 import yaml
 
 from datumaro.components.errors import ImmutableObjectError
 
+# Shared "no value" marker for lookups, to avoid
+# allocating a new sentinel object on every call
+_NOTSET = object()
+
 
 class Schema:
+    __slots__ = ('_items', '_fallback', '__weakref__')
+
     class Item:
+        __slots__ = ('ctor', 'internal')
+
         def __init__(self, ctor, internal=False):
             self.ctor = ctor
             self.internal = internal
@@ -43,7 +52,8 @@ class Schema:
         return self._get_items(allow_fallback=allow_fallback).values()
 
     def __contains__(self, key):
-        return key in self.keys()
+        return key in self._items or \
+            (self._fallback is not None and key in self._fallback)
 
     def __len__(self):
         return len(self._get_items())
@@ -52,22 +62,27 @@ class Schema:
         return iter(self._get_items())
 
     def __getitem__(self, key):
-        default = object()
-        value = self.get(key, default=default)
-        if value is default:
+        value = self.get(key, default=_NOTSET)
+        if value is _NOTSET:
             raise KeyError('Key "%s" does not exist' % (key, ))
         return value
 
     def get(self, key, default=None):
-        found = self._items.get(key, default)
-        if found is not default:
+        found = self._items.get(key, _NOTSET)
+        if found is not _NOTSET:
             return found
 
         if self._fallback is not None:
             return self._fallback.get(key, default)
-        return found
+        return default
 
 class SchemaBuilder:
+    __slots__ = ('_items', )
+
+    # Schemas with the same shape are shared. Weak references
+    # let unused entries be collected with their schemas.
+    _cache = weakref.WeakValueDictionary()
+
     def __init__(self):
         self._items = {}
 
@@ -79,7 +94,13 @@ class SchemaBuilder:
         return self
 
     def build(self):
-        return Schema(self._items)
+        key = tuple((name, item.ctor, item.internal)
+            for name, item in sorted(self._items.items()))
+        schema = self._cache.get(key)
+        if schema is None:
+            schema = Schema(self._items)
+            self._cache[key] = schema
+        return schema
 
 class Config:
     def __init__(self, config=None, fallback=None, schema=None, mutable=True):
@@ -100,7 +121,10 @@ class Config:
         all_config = {}
         if allow_fallback and self._schema is not None:
             for key, item in self._schema.items():
-                all_config[key] = item()
+                # don't build default values for the keys
+                # that are overridden anyway
+                if key not in self._config:
+                    all_config[key] = item()
         all_config.update(self._config)
 
         if not allow_internal and self._schema is not None:
@@ -128,7 +152,8 @@ class Config:
             ).values()
 
     def __contains__(self, key):
-        return key in self.keys()
+        return key in self._config or \
+            (self._schema is not None and key in self._schema)
 
     def __len__(self):
         return len(self.items())
@@ -137,9 +162,8 @@ class Config:
         return iter(self.keys())
 
     def __getitem__(self, key):
-        default = object()
-        value = self.get(key, default=default)
-        if value is default:
+        value = self.get(key, default=_NOTSET)
+        if value is _NOTSET:
             raise KeyError('Key "%s" does not exist' % (key, ))
         return value
 
@@ -147,9 +171,8 @@ class Config:
         return self.set(key, value)
 
     def __getattr__(self, key):
-        default = object()
-        found = self.get(key, default=default)
-        if found is default:
+        found = self.get(key, default=_NOTSET)
+        if found is _NOTSET:
             raise AttributeError(key)
         return found
 
@@ -158,11 +181,11 @@ class Config:
 
     def __eq__(self, other):
         try:
-            keys = set(self.keys()) | set(other.keys())
-            for k in keys:
-                my_v = self[k]
-                other_v = other[k]
-                if my_v != other_v:
+            my_items = self._items()
+            if set(my_items) != set(other.keys()):
+                return False
+            for k, my_v in my_items.items():
+                if my_v != other[k]:
                     return False
             return True
         except (KeyError, AttributeError):
@@ -182,41 +205,48 @@ class Config:
         self._config.pop(key, None)
 
     def get(self, key, default=None):
-        found = self._config.get(key, default)
-        if found is not default:
+        found = self._config.get(key, _NOTSET)
+        if found is not _NOTSET:
             return found
 
         if self._schema is not None:
-            found = self._schema.get(key, default)
-            if found is not default:
+            found = self._schema.get(key, _NOTSET)
+            if found is not _NOTSET:
                 # ignore mutability
                 found = found()
                 self._config[key] = found
                 return found
 
-        return found
+        return default
 
     def set(self, key, value):
         if not self._mutable:
             raise ImmutableObjectError()
 
         if self._schema is not None:
-            if key not in self._schema:
+            schema_entry = self._schema.get(key, _NOTSET)
+            if schema_entry is _NOTSET:
                 raise KeyError("Can not set key '%s' - schema mismatch: "
                     "unknown key" % (key, ))
 
-            schema_entry = self._schema[key]
-            schema_entry_instance = schema_entry()
-
-            if isinstance(value, (dict, Config)) and \
-                    isinstance(schema_entry_instance, Config):
-                schema_entry_instance.update(value)
-                value = schema_entry_instance
-            elif not isinstance(value, type(schema_entry_instance)):
-                raise ValueError("Can not set key '%s' - schema mismatch:"
-                    "unexpected value type %s, expected %s" % \
-                    (key, type(value), type(schema_entry_instance))
-                )
+            ctor = schema_entry.ctor
+            if isinstance(ctor, type) and not issubclass(ctor, Config) and \
+                    isinstance(value, ctor):
+                # The value already has the declared type, no need to
+                # build a default instance just for the check
+                pass
+            else:
+                schema_entry_instance = schema_entry()
+
+                if isinstance(value, (dict, Config)) and \
+                        isinstance(schema_entry_instance, Config):
+                    schema_entry_instance.update(value)
+                    value = schema_entry_instance
+                elif not isinstance(value, type(schema_entry_instance)):
+                    raise ValueError("Can not set key '%s' - schema mismatch:"
+                        "unexpected value type %s, expected %s" % \
+                        (key, type(value), type(schema_entry_instance))
+                    )
 
         self._config[key] = value
         return value
@@ -165,12 +165,13 @@ class Environment:
                     log.warning(*message)
                 continue
 
-            log.debug("Imported the following symbols from %s: %s" % \
-                (
-                    module_name,
-                    ', '.join(s.__name__ for s in exports)
+            if log.getLogger().isEnabledFor(log.DEBUG):
+                log.debug("Imported the following symbols from %s: %s" % \
+                    (
+                        module_name,
+                        ', '.join(s.__name__ for s in exports)
+                    )
                 )
-            )
             all_exports.extend(exports)
 
         return all_exports
@@ -2,6 +2,11 @@
 #
 # SPDX-License-Identifier: MIT
 
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
+
 import numpy as np
 
 from datumaro.components.annotation import AnnotationType, LabelCategories
@@ -23,30 +28,194 @@ class Launcher(CliPlugin):
 # pylint: enable=no-self-use
 
 class ModelTransform(Transform):
-    def __init__(self, extractor, launcher, batch_size=1):
+    def __init__(self, extractor, launcher, batch_size=1, prefetch=0,
+            cache_size=0, num_workers=0):
         super().__init__(extractor)
         self._launcher = launcher
         self._batch_size = batch_size
+        self._prefetch = prefetch
+        self._num_workers = num_workers
+        self._cache_size = cache_size
+        self._cache = OrderedDict() if cache_size else None
+        self._inputs_buffer = None
+        self._categories = None
 
     def __iter__(self):
-        for batch in take_by(self._extractor, self._batch_size):
-            inputs = np.array([np.atleast_3d(item.image.data)
-                for item in batch])
-            inference = self._launcher.launch(inputs)
+        if self._num_workers:
+            yield from self._iter_parallel()
+            return
+        if self._prefetch:
+            yield from self._iter_prefetched()
+            return
 
-            for item, annotations in zip(batch, inference):
-                self._check_annotations(annotations)
+        for items, batch_annotations in self.iter_batches():
+            for item, annotations in zip(items, batch_annotations):
                 yield self.wrap_item(item, annotations=annotations)
 
+    def iter_batches(self):
+        """
+        Yields (items, annotations) pairs, where annotations holds the
+        launcher output for the corresponding item. Batch-level
+        consumers can use this to avoid per-item dispatch.
+        """
+
+        # A fixed set of slots is reused between batches instead of
+        # growing a new list per batch
+        batch = [None] * self._batch_size
+        count = 0
+        for item in self._extractor:
+            batch[count] = item
+            count += 1
+            if count == self._batch_size:
+                yield tuple(batch), self._process_batch(batch)
+                count = 0
+        if count:
+            part = batch[:count]
+            yield tuple(part), self._process_batch(part)
+
+    def _process_batch(self, batch):
+        cached = {}
+        if self._cache is None:
+            todo = batch
+        else:
+            # On repeated iteration, items with cached results
+            # don't need to be sent to the launcher again. Cached
+            # entries are looked up before any insertions, so that
+            # eviction can't drop an entry the batch still needs.
+            todo = []
+            for item in batch:
+                key = (item.id, item.subset)
+                if key in self._cache:
+                    cached[key] = self._cache[key]
+                    self._cache.move_to_end(key)
+                else:
+                    todo.append(item)
+
+        results = {}
+        if todo:
+            images = [np.atleast_3d(item.image.data) for item in todo]
+
+            shape = images[0].shape
+            dtype = images[0].dtype
+            if any(img.shape != shape or img.dtype != dtype
+                    for img in images[1:]):
+                inputs = np.array(images)
+            else:
+                # Reuse one contiguous buffer between batches and
+                # fill it by slice assignment instead of stacking
+                # the items into a new array every time
+                buffer = self._inputs_buffer
+                if buffer is None or buffer.shape[1:] != shape or \
+                        buffer.dtype != dtype:
+                    buffer = np.empty((self._batch_size, ) + shape,
+                        dtype=dtype)
+                    self._inputs_buffer = buffer
+                for i, img in enumerate(images):
+                    buffer[i] = img
+                inputs = buffer[:len(images)]
+
+            inference = self._launcher.launch(inputs)
+            for item, annotations in zip(todo, inference):
+                results[(item.id, item.subset)] = annotations
+
+        batch_annotations = []
+        for item in batch:
+            key = (item.id, item.subset)
+            if key in results:
+                annotations = results[key]
+                if self._cache is not None:
+                    self._cache[key] = annotations
+            else:
+                annotations = cached[key]
+
+            self._check_annotations(annotations)
+            batch_annotations.append(annotations)
+
+        if self._cache is not None:
+            # Evict only after the whole batch is served
+            while self._cache_size < len(self._cache):
+                self._cache.popitem(last=False)
+        return batch_annotations
+
+    def _iter_prefetched(self):
+        # Assembles the next batches on a background thread, so that
+        # input loading overlaps with model inference
+        batches = queue.Queue(maxsize=self._prefetch)
+        done = object()
+
+        def _produce():
+            try:
+                for batch in take_by(self._extractor, self._batch_size):
+                    inputs = np.array([np.atleast_3d(item.image.data)
+                        for item in batch])
+                    batches.put((batch, inputs))
+            except Exception as e: # pylint: disable=broad-except
+                batches.put(e)
+            else:
+                batches.put(done)
+
+        producer = threading.Thread(target=_produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                entry = batches.get()
+                if entry is done:
+                    break
+                if isinstance(entry, Exception):
+                    raise entry
+                batch, inputs = entry
+                inference = self._launcher.launch(inputs)
+
+                for item, annotations in zip(batch, inference):
+                    self._check_annotations(annotations)
+                    yield self.wrap_item(item, annotations=annotations)
+        finally:
+            # Unblock the producer if iteration was abandoned early
+            while producer.is_alive():
+                try:
+                    batches.get_nowait()
+                except queue.Empty:
+                    producer.join(timeout=0.01)
+            producer.join()
+
+    def _iter_parallel(self):
+        # Runs inference for several batches concurrently. Results are
+        # yielded in the dataset order. The launcher must tolerate
+        # concurrent launch() calls for this mode to be usable.
+        def _launch(inputs):
+            return list(self._launcher.launch(inputs))
+
+        with ThreadPoolExecutor(max_workers=self._num_workers) as pool:
+            pending = deque()
+            for batch in take_by(self._extractor, self._batch_size):
+                inputs = np.array([np.atleast_3d(item.image.data)
+                    for item in batch])
+                pending.append((batch, pool.submit(_launch, inputs)))
+
+                if self._num_workers <= len(pending):
+                    yield from self._flush_batch(*pending.popleft())
+            while pending:
+                yield from self._flush_batch(*pending.popleft())
+
+    def _flush_batch(self, batch, launched):
+        for item, annotations in zip(batch, launched.result()):
+            self._check_annotations(annotations)
+            yield self.wrap_item(item, annotations=annotations)
+
     def get_subset(self, name):
         subset = self._extractor.get_subset(name)
-        return __class__(subset, self._launcher, self._batch_size)
+        return __class__(subset, self._launcher, self._batch_size,
+            prefetch=self._prefetch, cache_size=self._cache_size,
+            num_workers=self._num_workers)
 
     def categories(self):
-        launcher_override = self._launcher.categories()
-        if launcher_override is not None:
-            return launcher_override
-        return self._extractor.categories()
+        if self._categories is None:
+            launcher_override = self._launcher.categories()
+            if launcher_override is not None:
+                self._categories = launcher_override
+            else:
+                self._categories = self._extractor.categories()
+        return self._categories
 
     def transform_item(self, item):
         inputs = np.expand_dims(item.image, axis=0)
@@ -58,7 +227,7 @@ class ModelTransform(Transform):
             AnnotationType.label, LabelCategories()).items)
 
         for ann in annotations:
-            label = getattr(ann, 'label')
+            label = getattr(ann, 'label', None)
             if label is None:
                 continue
 
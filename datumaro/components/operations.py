@@ -431,31 +431,19 @@ class IntersectMerge(MergingStrategy):
         return clusters
 
     def _make_mergers(self, sources):
+        conf = attr.asdict(self.conf)
+
         def _make(c, **kwargs):
-            kwargs.update(attr.asdict(self.conf))
+            kwargs.update(conf)
             fields = attr.fields_dict(c)
             return c(**{ k: v for k, v in kwargs.items() if k in fields },
                 context=self)
 
         def _for_type(t, **kwargs):
-            if t is AnnotationType.label:
-                return _make(LabelMerger, **kwargs)
-            elif t is AnnotationType.bbox:
-                return _make(BboxMerger, **kwargs)
-            elif t is AnnotationType.mask:
-                return _make(MaskMerger, **kwargs)
-            elif t is AnnotationType.polygon:
-                return _make(PolygonMerger, **kwargs)
-            elif t is AnnotationType.polyline:
-                return _make(LineMerger, **kwargs)
-            elif t is AnnotationType.points:
-                return _make(PointsMerger, **kwargs)
-            elif t is AnnotationType.caption:
-                return _make(CaptionsMerger, **kwargs)
-            elif t is AnnotationType.cuboid_3d:
-                return _make(Cuboid3dMerger, **kwargs)
-            else:
+            merger_type = _MERGERS_BY_TYPE.get(t)
+            if merger_type is None:
                 raise NotImplementedError("Type %s is not supported" % t)
+            return _make(merger_type, **kwargs)
 
         instance_map = {}
         for s in sources:
@@ -922,6 +910,17 @@ class Cuboid3dMerger(_ShapeMerger, Cuboid3dMatcher):
 
         return shape
 
+_MERGERS_BY_TYPE = {
+    AnnotationType.label: LabelMerger,
+    AnnotationType.bbox: BboxMerger,
+    AnnotationType.mask: MaskMerger,
+    AnnotationType.polygon: PolygonMerger,
+    AnnotationType.polyline: LineMerger,
+    AnnotationType.points: PointsMerger,
+    AnnotationType.caption: CaptionsMerger,
+    AnnotationType.cuboid_3d: Cuboid3dMerger,
+}
+
 def match_segments(a_segms, b_segms, distance=segment_iou, dist_thresh=1.0,
         label_matcher=lambda a, b: a.label == b.label):
     assert callable(distance), distance
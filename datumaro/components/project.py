@@ -854,17 +854,22 @@ class ProjectBuildTargets(CrudProxy[BuildTarget]):
 
         return self._make_full_pipeline().get_slice(target)
 
+_git_module = None
+
 class GitWrapper:
     @staticmethod
     def module():
-        try:
-            import git
-            return git
-        except ModuleNotFoundError as e:
-            raise ModuleNotFoundError("Can't import the 'git' package. "
-                "Make sure GitPython is installed, or install it with "
-                "'pip install datumaro[default]'."
-            ) from e
+        global _git_module
+        if _git_module is None:
+            try:
+                import git
+                _git_module = git
+            except ModuleNotFoundError as e:
+                raise ModuleNotFoundError("Can't import the 'git' package. "
+                    "Make sure GitPython is installed, or install it with "
+                    "'pip install datumaro[default]'."
+                ) from e
+        return _git_module
 
     def _git_dir(self):
         return osp.join(self._project_dir, '.git')
@@ -957,8 +962,17 @@ class GitWrapper:
             assert is_subpath(base, base=repo_root), \
                 "Base path should be inside of the repo"
             base = osp.relpath(base, repo_root)
-            path_rewriter = lambda entry: osp.relpath(entry.path, base) \
-                .replace('\\', '/')
+
+            # Paths are mostly direct children of the base, so a string
+            # prefix cut is enough and is much cheaper than a generic
+            # relpath() computation per entry.
+            base_prefix = base.replace('\\', '/') + '/'
+            base_prefix_len = len(base_prefix)
+            def path_rewriter(entry):
+                path = entry.path.replace('\\', '/')
+                if path.startswith(base_prefix):
+                    return path[base_prefix_len:]
+                return osp.relpath(path, base).replace('\\', '/')
 
         if isinstance(paths, str):
             paths = [paths]
@@ -1134,20 +1148,25 @@ class GitWrapper:
             commits.append(commit)
         return commits
 
+_dvc_module = None
+
 class DvcWrapper:
     @staticmethod
     def module():
-        try:
-            import dvc
-            import dvc.env
-            import dvc.main
-            import dvc.repo
-            return dvc
-        except ModuleNotFoundError as e:
-            raise ModuleNotFoundError("Can't import the 'dvc' package. "
-                "Make sure DVC is installed, or install it with "
-                "'pip install datumaro[default]'."
-            ) from e
+        global _dvc_module
+        if _dvc_module is None:
+            try:
+                import dvc
+                import dvc.env
+                import dvc.main
+                import dvc.repo
+                _dvc_module = dvc
+            except ModuleNotFoundError as e:
+                raise ModuleNotFoundError("Can't import the 'dvc' package. "
+                    "Make sure DVC is installed, or install it with "
+                    "'pip install datumaro[default]'."
+                ) from e
+        return _dvc_module
 
     def _dvc_dir(self):
         return osp.join(self._project_dir, '.dvc')
@@ -1235,12 +1254,12 @@ class DvcWrapper:
             logs = es.enter_context(catch_logs('dvc'))
             retcode = self.module().main.main(args)
 
-        logs = logs.getvalue()
+        # Materialize the captured logs only when they are going to be
+        # used - commonly they are just dropped.
         if retcode != 0:
-            raise self.DvcError(logs)
+            raise self.DvcError(logs.getvalue())
         if not hide_output:
-            print(logs)
-        return logs
+            print(logs.getvalue())
 
     def is_cached(self, obj_hash):
         path = self.obj_path(obj_hash)
@@ -1436,6 +1455,9 @@ class DiffStatus(Enum):
 Revision = NewType('Revision', str) # a commit hash or a named reference
 ObjectId = NewType('ObjectId', str) # a commit or an object hash
 
+_SOURCE_NAME_DISALLOWED_RE = re.compile(r"[^\\ \.\~\-\w]")
+_RESERVED_SOURCE_NAMES = frozenset({'dataset', 'build', 'project'})
+
 class Project:
     @staticmethod
     def find_project_dir(path: str) -> Optional[str]:
@@ -1592,6 +1614,7 @@ class Project:
             self._config = ProjectConfig()
 
         self._env = Environment()
+        self._model_launchers = {} # launcher name -> resolved class
 
         plugins_dir = osp.join(self._aux_dir, ProjectLayout.plugins_dir)
         if osp.isdir(plugins_dir):
@@ -1868,8 +1891,7 @@ class Project:
         if not name:
             raise ValueError("Source name cannot be empty")
 
-        disallowed_symbols = r"[^\\ \.\~\-\w]"
-        found_wrong_symbols = re.findall(disallowed_symbols, name)
+        found_wrong_symbols = _SOURCE_NAME_DISALLOWED_RE.findall(name)
         if found_wrong_symbols:
             raise ValueError("Source name contains invalid symbols: %s" %
                 found_wrong_symbols)
@@ -1882,8 +1904,7 @@ class Project:
         if name.startswith('.'):
             raise ValueError("Source name can't start with '.'")
 
-        reserved_names = {'dataset', 'build', 'project'}
-        if name.lower() in reserved_names:
+        if name.lower() in _RESERVED_SOURCE_NAMES:
             raise ValueError("Source name is reserved for internal use")
 
     @scoped
@@ -2409,8 +2430,12 @@ class Project:
         model_dir = self.model_data_dir(name)
         if not osp.isdir(model_dir):
             model_dir = None
-        return self._env.make_launcher(model.launcher,
-            **model.options, model_dir=model_dir)
+
+        launcher_cls = self._model_launchers.get(model.launcher)
+        if launcher_cls is None:
+            launcher_cls = self._env.launchers[model.launcher]
+            self._model_launchers[model.launcher] = launcher_cls
+        return launcher_cls(**model.options, model_dir=model_dir)
 
     def add_model(self, name: str, launcher: str,
             options: Dict[str, Any] = None) -> Model:
@@ -96,7 +96,8 @@ class _TaskConverter:
                 next_id += 1
 
         with open(path, 'w', encoding='utf-8') as outfile:
-            json.dump(self._data, outfile, ensure_ascii=False)
+            json.dump(self._data, outfile, ensure_ascii=False,
+                separators=(',', ':'))
 
     @property
     def annotations(self):
@@ -457,7 +458,8 @@ class _StuffConverter(_InstancesConverter):
 class _PanopticConverter(_TaskConverter):
     def write(self, path):
         with open(path, 'w', encoding='utf-8') as outfile:
-            json.dump(self._data, outfile, ensure_ascii=False)
+            json.dump(self._data, outfile, ensure_ascii=False,
+                separators=(',', ':'))
 
     def save_categories(self, dataset):
         label_categories = dataset.categories().get(AnnotationType.label)
@@ -17,7 +17,7 @@ from .format import CvatPath
 
 
 class CvatExtractor(SourceExtractor):
-    _SUPPORTED_SHAPES = ('box', 'polygon', 'polyline', 'points')
+    _SUPPORTED_SHAPES = {'box', 'polygon', 'polyline', 'points'}
 
     def __init__(self, path, subset=None):
         assert osp.isfile(path), path
@@ -90,7 +90,7 @@ class CvatExtractor(SourceExtractor):
                 if el.tag == 'attribute' and attributes is not None:
                     attr_value = el.text or ''
                     attr_type = attribute_types.get(el.attrib['name'])
-                    if el.text in ['true', 'false']:
+                    if el.text in {'true', 'false'}:
                         attr_value = attr_value == 'true'
                     elif  attr_type is not None and attr_type != 'text':
                         try:
@@ -302,7 +302,8 @@ class CvatExtractor(SourceExtractor):
 
     def _load_items(self, parsed):
         for frame_id, item_desc in parsed.items():
-            name = item_desc.get('name', 'frame_%06d.png' % int(frame_id))
+            frame_num = int(frame_id)
+            name = item_desc.get('name', 'frame_%06d.png' % frame_num)
             image = osp.join(self._images_dir, name)
             image_size = (item_desc.get('height'), item_desc.get('width'))
             if all(image_size):
@@ -311,7 +312,7 @@ class CvatExtractor(SourceExtractor):
             parsed[frame_id] = DatasetItem(id=osp.splitext(name)[0],
                 subset=self._subset, image=image,
                 annotations=item_desc.get('annotations'),
-                attributes={'frame': int(frame_id)})
+                attributes={'frame': frame_num})
         return parsed
 
 class CvatImporter(Importer):
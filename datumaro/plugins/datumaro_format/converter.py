@@ -140,7 +140,8 @@ class _SubsetWriter:
 
     def write(self, ann_file):
         with open(ann_file, 'w', encoding='utf-8') as f:
-            json.dump(self._data, f, ensure_ascii=False)
+            json.dump(self._data, f, ensure_ascii=False,
+                separators=(',', ':'))
 
     def _convert_annotation(self, obj):
         assert isinstance(obj, Annotation)
@@ -156,9 +157,7 @@ class _SubsetWriter:
     def _convert_label_object(self, obj):
         converted = self._convert_annotation(obj)
 
-        converted.update({
-            'label_id': cast(obj.label, int),
-        })
+        converted['label_id'] = cast(obj.label, int)
         return converted
 
     def _convert_mask_object(self, obj):
@@ -175,26 +174,22 @@ class _SubsetWriter:
         else:
            counts = rle['counts'].decode('ascii')
 
-        converted.update({
-            'label_id': cast(obj.label, int),
-            'rle': {
-                # serialize as compressed COCO mask
-                'counts': counts,
-                'size': list(int(c) for c in rle['size']),
-            },
-            'z_order': obj.z_order,
-        })
+        converted['label_id'] = cast(obj.label, int)
+        converted['rle'] = {
+            # serialize as compressed COCO mask
+            'counts': counts,
+            'size': list(int(c) for c in rle['size']),
+        }
+        converted['z_order'] = obj.z_order
         return converted
 
     def _convert_shape_object(self, obj):
         assert isinstance(obj, _Shape)
         converted = self._convert_annotation(obj)
 
-        converted.update({
-            'label_id': cast(obj.label, int),
-            'points': [float(p) for p in obj.points],
-            'z_order': obj.z_order,
-        })
+        converted['label_id'] = cast(obj.label, int)
+        converted['points'] = [float(p) for p in obj.points]
+        converted['z_order'] = obj.z_order
         return converted
 
     def _convert_polyline_object(self, obj):
@@ -212,27 +207,21 @@ class _SubsetWriter:
     def _convert_points_object(self, obj):
         converted = self._convert_shape_object(obj)
 
-        converted.update({
-            'visibility': [int(v.value) for v in obj.visibility],
-        })
+        converted['visibility'] = [int(v.value) for v in obj.visibility]
         return converted
 
     def _convert_caption_object(self, obj):
         converted = self._convert_annotation(obj)
 
-        converted.update({
-            'caption': cast(obj.caption, str),
-        })
+        converted['caption'] = cast(obj.caption, str)
         return converted
 
     def _convert_cuboid_3d_object(self, obj):
         converted = self._convert_annotation(obj)
-        converted.update({
-            'label_id': cast(obj.label, int),
-            'position': [float(p) for p in obj.position],
-            'rotation': [float(p) for p in obj.rotation],
-            'scale': [float(p) for p in obj.scale]
-        })
+        converted['label_id'] = cast(obj.label, int)
+        converted['position'] = [float(p) for p in obj.position]
+        converted['rotation'] = [float(p) for p in obj.rotation]
+        converted['scale'] = [float(p) for p in obj.scale]
         return converted
 
     def _convert_attribute_categories(self, attributes):
@@ -556,7 +556,7 @@ class RemapLabels(ItemTransform, CliPlugin):
     def transform_item(self, item):
         annotations = []
         for ann in item.annotations:
-            if getattr(ann, 'label') is not None:
+            if getattr(ann, 'label', None) is not None:
                 conv_label = self._map_id(ann.label)
                 if conv_label is not None:
                     annotations.append(ann.wrap(label=conv_label))
@@ -572,7 +572,7 @@ class AnnsToLabels(ItemTransform, CliPlugin):
 
     def transform_item(self, item):
         labels = set(p.label for p in item.annotations
-            if getattr(p, 'label') != None)
+            if getattr(p, 'label', None) != None)
         annotations = []
         for label in labels:
             annotations.append(Label(label=label))
@@ -383,8 +383,7 @@ class VocConverter(Converter):
 
         if items or self._keep_empty:
             with open(ann_file, 'w', encoding='utf-8') as f:
-                for item in items:
-                    f.write('%s\n' % item)
+                f.writelines('%s\n' % item for item in items)
         elif osp.isfile(ann_file):
             os.remove(ann_file)
 
@@ -462,8 +461,7 @@ class VocConverter(Converter):
 
         if items or self._keep_empty:
             with open(ann_file, 'w', encoding='utf-8') as f:
-                for item in items:
-                    f.write('%s\n' % item)
+                f.writelines('%s\n' % item for item in items)
         elif osp.isfile(ann_file):
             os.remove(ann_file)
 
@@ -477,8 +475,7 @@ class VocConverter(Converter):
 
         if items or self._keep_empty:
             with open(ann_file, 'w', encoding='utf-8') as f:
-                for item in items:
-                    f.write('%s\n' % item)
+                f.writelines('%s\n' % item for item in items)
         elif osp.isfile(ann_file):
             os.remove(ann_file)
 
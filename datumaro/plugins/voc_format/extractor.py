@@ -36,12 +36,13 @@ class _VocExtractor(SourceExtractor):
 
         label_color = lambda label_idx: \
             self._categories[AnnotationType.mask].colormap.get(label_idx, None)
-        log.debug("Loaded labels: %s" % ', '.join(
-            "'%s' %s" % (l.name, ('(%s, %s, %s)' % c) if c else '')
-            for i, l, c in ((i, l, label_color(i)) for i, l in enumerate(
-                self._categories[AnnotationType.label].items
+        if log.getLogger().isEnabledFor(log.DEBUG):
+            log.debug("Loaded labels: %s" % ', '.join(
+                "'%s' %s" % (l.name, ('(%s, %s, %s)' % c) if c else '')
+                for i, l, c in ((i, l, label_color(i)) for i, l in enumerate(
+                    self._categories[AnnotationType.label].items
+                ))
             ))
-        ))
         self._items = { item: None for item in self._load_subset_list(path) }
 
     def _get_label_id(self, label):
@@ -93,7 +94,7 @@ class VocClassificationExtractor(_VocExtractor):
             images = {}
 
         for item_id in self._items:
-            log.debug("Reading item '%s'" % item_id)
+            log.debug("Reading item '%s'", item_id)
             anns = self._parse_annotations(raw_anns, item_id)
             yield DatasetItem(id=item_id, subset=self._subset,
                 image=images.get(item_id), annotations=anns)
@@ -126,7 +127,7 @@ class _VocXmlExtractor(_VocExtractor):
         anno_dir = osp.join(self._dataset_dir, VocPath.ANNOTATIONS_DIR)
 
         for item_id in self._items:
-            log.debug("Reading item '%s'" % item_id)
+            log.debug("Reading item '%s'", item_id)
             image = item_id + VocPath.IMAGE_EXT
             height, width = 0, 0
 
@@ -269,7 +270,7 @@ class VocSegmentationExtractor(_VocExtractor):
             images = {}
 
         for item_id in self._items:
-            log.debug("Reading item '%s'" % item_id)
+            log.debug("Reading item '%s'", item_id)
             anns = self._load_annotations(item_id)
             yield DatasetItem(id=item_id, subset=self._subset,
                 image=images.get(item_id), annotations=anns)
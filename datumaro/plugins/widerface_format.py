@@ -123,7 +123,7 @@ class WiderFaceExtractor(SourceExtractor):
                         i = 4
                         for attr in WiderFacePath.BBOX_ATTRIBUTES:
                             if bbox_list[i] != '-':
-                                if bbox_list[i] in ['True', 'False']:
+                                if bbox_list[i] in {'True', 'False'}:
                                     attributes[attr] = str_to_bool(bbox_list[i])
                                 else:
                                     attributes[attr] = bbox_list[i]
@@ -17,6 +17,7 @@ from datumaro.util.os_util import split_path
 
 from .format import YoloPath
 
+_CONFIG_ENTRY_RE = re.compile(r'(\w+)\s*=\s*(.+)$')
 
 class YoloExtractor(SourceExtractor):
     class Subset(Extractor):
@@ -63,7 +64,7 @@ class YoloExtractor(SourceExtractor):
         names_path = None
 
         for line in config_lines:
-            match = re.match(r'(\w+)\s*=\s*(.+)$', line)
+            match = _CONFIG_ENTRY_RE.match(line)
             if not match:
                 continue
 
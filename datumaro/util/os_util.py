@@ -31,6 +31,9 @@ from . import cast
 
 DEFAULT_MAX_DEPTH = 10
 
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')
+_SPACES_RE = re.compile(r'[-\s]+')
+
 def check_instruction_set(instruction):
     return instruction == str.strip(
         # Let's ignore a warning from bandit about using shell=True.
@@ -173,8 +176,8 @@ def make_file_name(s: str) -> str:
     """
     s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore')
     s = s.decode()
-    s = re.sub(r'[^\w\s-]', '', s).strip().lower()
-    s = re.sub(r'[-\s]+', '-', s)
+    s = _SPECIAL_CHARS_RE.sub('', s).strip().lower()
+    s = _SPACES_RE.sub('-', s)
     return s
 
 def generate_next_name(names: Iterable[str], basename: str,
@@ -75,7 +75,15 @@ class TestDir(FileRemover):
         path = self.path
 
         if path is None:
-            path = tempfile.mkdtemp(dir=os.getcwd(), prefix=self._prefix)
+            base_dir = os.environ.get('DATUMARO_TEST_DIR')
+            if not base_dir:
+                # Prefer tmpfs, when available, to avoid paying disk IO
+                # latency for short-lived test files
+                if osp.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+                    base_dir = '/dev/shm'
+                else:
+                    base_dir = os.getcwd()
+            path = tempfile.mkdtemp(dir=base_dir, prefix=self._prefix)
             self.path = path
         else:
             os.makedirs(path, exist_ok=False)
@@ -23,7 +23,7 @@ from datumaro.components.errors import (
 from datumaro.components.extractor import (
     DEFAULT_SUBSET_NAME, DatasetItem, Extractor, ItemTransform, Transform,
 )
-from datumaro.components.launcher import Launcher
+from datumaro.components.launcher import Launcher, ModelTransform
 from datumaro.util.image import Image
 from datumaro.util.test_utils import TestDir, compare_datasets
 
@@ -1210,8 +1210,9 @@ class DatasetTest(TestCase):
                 nonlocal calls
                 calls += 1
 
-                for i, inp in enumerate(inputs):
-                    yield [ Label(0, attributes={'idx': i, 'data': inp.item()}) ]
+                data = np.asarray(inputs).reshape(len(inputs)).tolist()
+                return [ [ Label(0, attributes={'idx': i, 'data': value}) ]
+                    for i, value in enumerate(data) ]
 
         model = TestLauncher()
 
@@ -1220,6 +1221,116 @@ class DatasetTest(TestCase):
         compare_datasets(self, expected, actual, require_images=True)
         self.assertEqual(2, calls)
 
+    @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    def test_can_run_model_with_prefetch(self):
+        batch_size = 2
+
+        dataset = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]))
+            for i in range(5)
+        ], categories=['label'])
+
+        expected = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]), annotations=[
+                Label(0, attributes={ 'idx': i % batch_size, 'data': i })
+            ])
+            for i in range(5)
+        ], categories=['label'])
+
+        class TestLauncher(Launcher):
+            def launch(self, inputs):
+                data = np.asarray(inputs).reshape(len(inputs)).tolist()
+                return [ [ Label(0, attributes={'idx': i, 'data': value}) ]
+                    for i, value in enumerate(data) ]
+
+        actual = Dataset.from_extractors(ModelTransform(dataset,
+            TestLauncher(), batch_size=batch_size, prefetch=2))
+
+        compare_datasets(self, expected, actual, require_images=True)
+
+    @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    def test_can_run_model_in_parallel(self):
+        dataset = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]))
+            for i in range(5)
+        ], categories=['label'])
+
+        expected = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]), annotations=[
+                Label(0, attributes={ 'data': i })
+            ])
+            for i in range(5)
+        ], categories=['label'])
+
+        class TestLauncher(Launcher):
+            def launch(self, inputs):
+                data = np.asarray(inputs).reshape(len(inputs)).tolist()
+                return [ [ Label(0, attributes={'data': value}) ]
+                    for value in data ]
+
+        actual = Dataset.from_extractors(ModelTransform(dataset,
+            TestLauncher(), batch_size=2, num_workers=2))
+
+        compare_datasets(self, expected, actual, require_images=True)
+
+    @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    def test_can_cache_model_outputs(self):
+        dataset = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]))
+            for i in range(5)
+        ], categories=['label'])
+
+        calls = 0
+
+        class TestLauncher(Launcher):
+            def launch(self, inputs):
+                nonlocal calls
+                calls += 1
+
+                data = np.asarray(inputs).reshape(len(inputs)).tolist()
+                return [ [ Label(0, attributes={'data': value}) ]
+                    for value in data ]
+
+        transformed = ModelTransform(dataset, TestLauncher(),
+            batch_size=2, cache_size=10)
+
+        first_pass = list(transformed)
+        second_pass = list(transformed)
+
+        compare_datasets(self,
+            Dataset.from_iterable(first_pass, categories=['label']),
+            Dataset.from_iterable(second_pass, categories=['label']),
+            require_images=True)
+        self.assertEqual(3, calls) # only the first pass launched
+
+    @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    def test_can_run_model_with_cache_smaller_than_dataset(self):
+        dataset = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]))
+            for i in range(5)
+        ], categories=['label'])
+
+        expected = Dataset.from_iterable([
+            DatasetItem(i, image=np.array([i]), annotations=[
+                Label(0, attributes={ 'data': i })
+            ])
+            for i in range(5)
+        ], categories=['label'])
+
+        class TestLauncher(Launcher):
+            def launch(self, inputs):
+                data = np.asarray(inputs).reshape(len(inputs)).tolist()
+                return [ [ Label(0, attributes={'data': value}) ]
+                    for value in data ]
+
+        transformed = ModelTransform(dataset, TestLauncher(),
+            batch_size=2, cache_size=1)
+
+        for _ in range(2):
+            actual = Dataset.from_iterable(list(transformed),
+                categories=['label'])
+            compare_datasets(self, expected, actual, require_images=True)
+
     @mark_requirement(Requirements.DATUM_BUG_259)
     def test_can_filter_items(self):
         dataset = Dataset.from_iterable([
@@ -1,7 +1,9 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
+import atexit
 import os
 import os.path as osp
 import shutil
+import tempfile
 import textwrap
 
 import numpy as np
@@ -23,6 +25,135 @@ from datumaro.util.test_utils import TestDir, compare_datasets, compare_dirs
 
 from .requirements import Requirements, mark_requirement
 
+_pristine_project_dir = None
+
+def init_test_project(path: str) -> Project:
+    """
+    Initializes a new project at the path, like Project.init() does,
+    but reuses a shared pristine project skeleton to avoid paying
+    the Git and DVC initialization cost in every test.
+
+    The skeleton directory is unique per process, so concurrent
+    test runners (e.g. pytest-xdist workers) don't share state.
+    """
+
+    global _pristine_project_dir
+    if _pristine_project_dir is None:
+        _pristine_project_dir = tempfile.mkdtemp(
+            prefix='datumaro_test_project_seed')
+        atexit.register(shutil.rmtree, _pristine_project_dir,
+            ignore_errors=True)
+        Project.init(_pristine_project_dir).close()
+
+    os.makedirs(path, exist_ok=True)
+    for entry in os.scandir(_pristine_project_dir):
+        dst = osp.join(path, entry.name)
+        if entry.is_dir():
+            shutil.copytree(entry.path, dst)
+        else:
+            shutil.copy(entry.path, dst)
+    return Project(path)
+
+_source_seed_dir = None
+
+def make_test_source(url: str) -> Dataset:
+    """
+    Creates a small test dataset at the url. The dataset is serialized
+    only once into a shared seed directory and then hardlink-copied
+    into place, saving the repeated image and annotation encoding.
+    The seed directory is unique per process, which keeps concurrent
+    test runners isolated.
+    """
+
+    def _link_or_copy(src, dst):
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    dataset = Dataset.from_iterable([
+        DatasetItem(0, image=np.ones((2, 3, 3)),
+            annotations=[ Bbox(1, 2, 3, 4, label=0) ]),
+        DatasetItem(1, subset='s', image=np.zeros((10, 20, 3)),
+            annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
+    ], categories=['a', 'b'])
+
+    global _source_seed_dir
+    if _source_seed_dir is None:
+        _source_seed_dir = tempfile.mkdtemp(
+            prefix='datumaro_test_source_seed')
+        atexit.register(shutil.rmtree, _source_seed_dir,
+            ignore_errors=True)
+        dataset.save(_source_seed_dir, save_images=True)
+
+    shutil.copytree(_source_seed_dir, url, copy_function=_link_or_copy)
+    return dataset
+
+# Shared read-only test images, to avoid reallocating
+# identical arrays in every test
+_IMG_ZEROS_2X2 = np.zeros([2, 2, 3])
+_IMG_ZEROS_2X2.setflags(write=False)
+_IMG_ONES_2X2 = np.ones([2, 2, 3])
+_IMG_ONES_2X2.setflags(write=False)
+
+_seen_file_dirs = set()
+
+def write_test_file(path: str, text: str = 'hello'):
+    """
+    Creates a small text file for a test, making the parent directory
+    on demand. Created directories are remembered, so sibling files
+    don't repeat the stat walk done by os.makedirs.
+    """
+
+    parent = osp.dirname(path)
+    if parent and parent not in _seen_file_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _seen_file_dirs.add(parent)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, text.encode())
+    finally:
+        os.close(fd)
+
+def make_project_with_file_source():
+    """
+    Creates a test dir with a small file source imported into a fresh
+    project - the scaffolding shared by several tests below.
+    Returns (test_dir, source_url, project).
+    """
+
+    test_dir = scope_add(TestDir(frame_id=3))
+    source_url = osp.join(test_dir, 'test_source.txt')
+    write_test_file(source_url)
+
+    project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
+    project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
+    return test_dir, source_url, project
+
+# Allows to cut the heaviest multi-commit VCS tests from
+# local development loops. They always run by default.
+skip_slow_vcs_test = skipIf(
+    os.environ.get('DATUMARO_SKIP_SLOW_VCS') == '1',
+    "Slow VCS test, disabled by DATUMARO_SKIP_SLOW_VCS")
+
+def remove_dir_in_test(path: str):
+    """
+    Works like shutil.rmtree, but moves the directory away with a
+    single rename, leaving the recursive removal to run at interpreter
+    exit instead of in the middle of a test. The stash is created next
+    to the target, so that the rename never crosses filesystems.
+    """
+
+    stash = tempfile.mkdtemp(prefix='datumaro_test_trash',
+        dir=osp.dirname(path))
+    try:
+        os.replace(path, osp.join(stash, osp.basename(path)))
+    except OSError:
+        shutil.rmtree(path)
+        os.rmdir(stash)
+    else:
+        atexit.register(shutil.rmtree, stash, ignore_errors=True)
+
 
 class ProjectTest(TestCase):
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
@@ -40,7 +171,7 @@ class ProjectTest(TestCase):
     def test_can_find_project_in_project_dir(self):
         test_dir = scope_add(TestDir())
 
-        scope_add(Project.init(test_dir))
+        scope_add(init_test_project(test_dir))
 
         self.assertEqual(osp.join(test_dir, '.datumaro'),
             Project.find_project_dir(test_dir))
@@ -65,7 +196,7 @@ class ProjectTest(TestCase):
         })
 
         test_dir = scope_add(TestDir())
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
         project.env.launchers.register('test', TestLauncher)
 
         project.add_model(source_name,
@@ -80,12 +211,12 @@ class ProjectTest(TestCase):
     def test_can_run_inference(self):
         class TestLauncher(Launcher):
             def launch(self, inputs):
-                for inp in inputs:
-                    yield [ Label(inp[0, 0, 0]) ]
+                return [ [ Label(int(label)) ]
+                    for label in np.asarray(inputs)[:, 0, 0, 0].tolist() ]
 
         expected = Dataset.from_iterable([
-            DatasetItem(0, image=np.zeros([2, 2, 3]), annotations=[Label(0)]),
-            DatasetItem(1, image=np.ones([2, 2, 3]), annotations=[Label(1)])
+            DatasetItem(0, image=_IMG_ZEROS_2X2, annotations=[Label(0)]),
+            DatasetItem(1, image=_IMG_ONES_2X2, annotations=[Label(1)])
         ], categories=['a', 'b'])
 
         launcher_name = 'custom_launcher'
@@ -94,12 +225,12 @@ class ProjectTest(TestCase):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'source')
         source_dataset = Dataset.from_iterable([
-            DatasetItem(0, image=np.ones([2, 2, 3]) * 0),
-            DatasetItem(1, image=np.ones([2, 2, 3]) * 1),
+            DatasetItem(0, image=_IMG_ZEROS_2X2),
+            DatasetItem(1, image=_IMG_ONES_2X2),
         ], categories=['a', 'b'])
         source_dataset.save(source_url, save_images=True)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.env.launchers.register(launcher_name, TestLauncher)
         project.add_model(model_name, launcher=launcher_name)
         project.import_source('source', source_url, format=DEFAULT_FORMAT)
@@ -117,11 +248,9 @@ class ProjectTest(TestCase):
         test_dir = scope_add(TestDir())
         source_base_url = osp.join(test_dir, 'test_repo')
         source_file_path = osp.join(source_base_url, 'x', 'y.txt')
-        os.makedirs(osp.dirname(source_file_path), exist_ok=True)
-        with open(source_file_path, 'w') as f:
-            f.write('hello')
+        write_test_file(source_file_path)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_base_url, format='fmt')
 
         source = project.working_tree.sources['s1']
@@ -151,7 +280,7 @@ class ProjectTest(TestCase):
                 annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
         ], categories=['a', 'b'])
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
 
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT,
             rpath=osp.join('annotations', 'b.json'))
@@ -174,7 +303,7 @@ class ProjectTest(TestCase):
         source_url = osp.join(test_dir, 'source')
         os.makedirs(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
 
         with self.assertRaises(PathOutsideSourceError):
             project.import_source('s1', url=source_url,
@@ -185,10 +314,9 @@ class ProjectTest(TestCase):
     def test_cant_import_local_source_with_url_inside_project(self):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'qq')
-        with open(source_url, 'w') as f:
-            f.write('hello')
+        write_test_file(source_url, 'hello')
 
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
 
         with self.assertRaises(SourceUrlInsideProjectError):
             project.import_source('s1', url=source_url,
@@ -210,7 +338,7 @@ class ProjectTest(TestCase):
         ], categories=['c', 'd'])
         dataset2.save(source2_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source1_url, format=DEFAULT_FORMAT)
         project.import_source('s2', url=source2_url, format=DEFAULT_FORMAT)
 
@@ -230,7 +358,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         with self.assertRaises(SourceExistsError):
@@ -246,7 +374,7 @@ class ProjectTest(TestCase):
             'format': 'fmt',
             'options': { 'c': 5, 'd': 'hello' }
         })
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
 
         project.import_source(source_name, url='',
             format=origin.format, options=origin.options)
@@ -261,7 +389,7 @@ class ProjectTest(TestCase):
     @scoped
     def test_cant_import_source_with_wrong_name(self):
         test_dir = scope_add(TestDir())
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
 
         for name in {'dataset', 'project', 'build', '.any'}:
             with self.subTest(name=name), \
@@ -271,14 +399,7 @@ class ProjectTest(TestCase):
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
     @scoped
     def test_can_remove_source_and_keep_data(self):
-        test_dir = scope_add(TestDir())
-        source_url = osp.join(test_dir, 'test_source.txt')
-        os.makedirs(osp.dirname(source_url), exist_ok=True)
-        with open(source_url, 'w') as f:
-            f.write('hello')
-
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
-        project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
+        test_dir, source_url, project = make_project_with_file_source()
 
         project.remove_source('s1', keep_data=True)
 
@@ -290,14 +411,7 @@ class ProjectTest(TestCase):
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
     @scoped
     def test_can_remove_source_and_wipe_data(self):
-        test_dir = scope_add(TestDir())
-        source_url = osp.join(test_dir, 'test_source.txt')
-        os.makedirs(osp.dirname(source_url), exist_ok=True)
-        with open(source_url, 'w') as f:
-            f.write('hello')
-
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
-        project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
+        test_dir, source_url, project = make_project_with_file_source()
 
         project.remove_source('s1', keep_data=False)
 
@@ -311,22 +425,16 @@ class ProjectTest(TestCase):
     def test_can_redownload_source_rev_noncached(self):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'source')
-        source_dataset = Dataset.from_iterable([
-            DatasetItem(0, image=np.ones((2, 3, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=0) ]),
-            DatasetItem(1, subset='s', image=np.zeros((10, 20, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
-        ], categories=['a', 'b'])
-        source_dataset.save(source_url, save_images=True)
+        source_dataset = make_test_source(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("A commit")
 
         # remove local source data
         project.remove_cache_obj(
             project.working_tree.build_targets['s1'].head.hash)
-        shutil.rmtree(project.source_data_dir('s1'))
+        remove_dir_in_test(project.source_data_dir('s1'))
 
         read_dataset = project.working_tree.make_dataset('s1')
 
@@ -339,22 +447,16 @@ class ProjectTest(TestCase):
     def test_can_redownload_source_and_check_data_hash(self):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'source')
-        source_dataset = Dataset.from_iterable([
-            DatasetItem(0, image=np.ones((2, 3, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=0) ]),
-            DatasetItem(1, subset='s', image=np.zeros((10, 20, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
-        ], categories=['a', 'b'])
-        source_dataset.save(source_url, save_images=True)
+        source_dataset = make_test_source(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("A commit")
 
         # remove local source data
         project.remove_cache_obj(
             project.working_tree.build_targets['s1'].head.hash)
-        shutil.rmtree(project.source_data_dir('s1'))
+        remove_dir_in_test(project.source_data_dir('s1'))
 
         # modify the source repo
         with open(osp.join(source_url, 'extra_file.txt'), 'w') as f:
@@ -368,19 +470,13 @@ class ProjectTest(TestCase):
     def test_can_use_source_from_cache_with_working_copy(self):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'source')
-        source_dataset = Dataset.from_iterable([
-            DatasetItem(0, image=np.ones((2, 3, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=0) ]),
-            DatasetItem(1, subset='s', image=np.zeros((10, 20, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
-        ], categories=['a', 'b'])
-        source_dataset.save(source_url, save_images=True)
+        source_dataset = make_test_source(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("A commit")
 
-        shutil.rmtree(project.source_data_dir('s1'))
+        remove_dir_in_test(project.source_data_dir('s1'))
 
         read_dataset = project.working_tree.make_dataset('s1')
 
@@ -392,15 +488,9 @@ class ProjectTest(TestCase):
     def test_raises_an_error_if_local_data_unknown(self):
         test_dir = scope_add(TestDir())
         source_url = osp.join(test_dir, 'source')
-        source_dataset = Dataset.from_iterable([
-            DatasetItem(0, image=np.ones((2, 3, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=0) ]),
-            DatasetItem(1, subset='s', image=np.zeros((10, 20, 3)),
-                annotations=[ Bbox(1, 2, 3, 4, label=1) ]),
-        ], categories=['a', 'b'])
-        source_dataset.save(source_url, save_images=True)
+        source_dataset = make_test_source(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("A commit")
 
@@ -429,7 +519,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         source_dataset.save(source_url, save_images=True)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         read_dataset = project.working_tree.make_dataset('s1')
@@ -450,11 +540,11 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         source_dataset.save(source_url, save_images=True)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("A commit")
 
-        shutil.rmtree(project.source_data_dir('s1'))
+        remove_dir_in_test(project.source_data_dir('s1'))
 
         read_dataset = project.head.make_dataset('s1')
 
@@ -472,7 +562,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         source_dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         read_dataset = project.working_tree.make_dataset()
@@ -489,7 +579,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         built_dataset = project.working_tree.make_dataset('s1')
@@ -510,7 +600,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         new_tree = project.working_tree.clone()
@@ -538,7 +628,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         stage = project.working_tree.build_targets.add_convert_stage('s1',
@@ -567,7 +657,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.working_tree.env.transforms.register('tr', TestTransform)
 
@@ -603,7 +693,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
 
         built_dataset = project.working_tree.make_dataset('s1.root')
@@ -614,7 +704,7 @@ class ProjectTest(TestCase):
     @scoped
     def test_can_commit(self):
         test_dir = scope_add(TestDir())
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
 
         commit_hash = project.commit("First commit", allow_empty=True)
 
@@ -627,7 +717,7 @@ class ProjectTest(TestCase):
     @scoped
     def test_cant_commit_empty(self):
         test_dir = scope_add(TestDir())
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
 
         with self.assertRaises(EmptyCommitError):
             project.commit("First commit")
@@ -635,21 +725,13 @@ class ProjectTest(TestCase):
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
     @scoped
     def test_can_commit_patch(self):
-        test_dir = scope_add(TestDir())
-        source_url = osp.join(test_dir, 'test_source.txt')
-        os.makedirs(osp.dirname(source_url), exist_ok=True)
-        with open(source_url, 'w') as f:
-            f.write('hello')
-
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
-        project.import_source('s1', source_url, format=DEFAULT_FORMAT)
+        test_dir, source_url, project = make_project_with_file_source()
         project.commit("First commit")
 
         source_path = osp.join(
             project.source_data_dir('s1'),
             osp.basename(source_url))
-        with open(source_path, 'w') as f:
-            f.write('world')
+        write_test_file(source_path, 'world')
 
         commit_hash = project.commit("Second commit", allow_foreign=True)
 
@@ -663,43 +745,28 @@ class ProjectTest(TestCase):
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
     @scoped
     def test_cant_commit_foreign_changes(self):
-        test_dir = scope_add(TestDir())
-        source_url = osp.join(test_dir, 'test_source.txt')
-        os.makedirs(osp.dirname(source_url), exist_ok=True)
-        with open(source_url, 'w') as f:
-            f.write('hello')
-
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
-        project.import_source('s1', source_url, format=DEFAULT_FORMAT)
+        test_dir, source_url, project = make_project_with_file_source()
         project.commit("First commit")
 
         source_path = osp.join(
             project.source_data_dir('s1'),
             osp.basename(source_url))
-        with open(source_path, 'w') as f:
-            f.write('world')
+        write_test_file(source_path, 'world')
 
         with self.assertRaises(ForeignChangesError):
             project.commit("Second commit")
 
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    @skip_slow_vcs_test
     @scoped
     def test_can_checkout_revision(self):
-        test_dir = scope_add(TestDir())
-        source_url = osp.join(test_dir, 'test_source.txt')
-        os.makedirs(osp.dirname(source_url), exist_ok=True)
-        with open(source_url, 'w') as f:
-            f.write('hello')
-
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
-        project.import_source('s1', source_url, format=DEFAULT_FORMAT)
+        test_dir, source_url, project = make_project_with_file_source()
         project.commit("First commit")
 
         source_path = osp.join(
             project.source_data_dir('s1'),
             osp.basename(source_url))
-        with open(source_path, 'w') as f:
-            f.write('world')
+        write_test_file(source_path, 'world')
         project.commit("Second commit", allow_foreign=True)
 
         project.checkout('HEAD~1')
@@ -719,12 +786,12 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.import_source('s2', url=source_url, format=DEFAULT_FORMAT)
         project.commit("Commit 1")
         project.remove_source('s1', keep_data=False) # remove s1 from tree
-        shutil.rmtree(project.source_data_dir('s2')) # modify s2 "manually"
+        remove_dir_in_test(project.source_data_dir('s2')) # modify s2 "manually"
 
         project.checkout(sources=['s1', 's2'])
 
@@ -746,7 +813,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.commit("Commit 1")
         project.remove_source('s1', keep_data=False)
@@ -757,6 +824,7 @@ class ProjectTest(TestCase):
         compare_dirs(self, source_url, project.source_data_dir('s1'))
 
     @mark_requirement(Requirements.DATUM_GENERAL_REQ)
+    @skip_slow_vcs_test
     @scoped
     def test_can_check_status(self):
         test_dir = scope_add(TestDir())
@@ -767,7 +835,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.import_source('s2', url=source_url, format=DEFAULT_FORMAT)
         project.import_source('s3', url=source_url, format=DEFAULT_FORMAT)
@@ -778,7 +846,7 @@ class ProjectTest(TestCase):
         project.remove_source('s2')
         project.import_source('s6', url=source_url, format=DEFAULT_FORMAT)
 
-        shutil.rmtree(project.source_data_dir('s3'))
+        remove_dir_in_test(project.source_data_dir('s3'))
 
         project.working_tree.build_targets \
             .add_transform_stage('s4', 'reindex')
@@ -809,7 +877,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         project.import_source('s2', url=source_url, format=DEFAULT_FORMAT)
         rev1 = project.commit("Commit 1")
@@ -833,7 +901,7 @@ class ProjectTest(TestCase):
         ], categories=['a', 'b'])
         dataset.save(source_url)
 
-        project = scope_add(Project.init(osp.join(test_dir, 'proj')))
+        project = scope_add(init_test_project(osp.join(test_dir, 'proj')))
         project.import_source('s1', url=source_url, format=DEFAULT_FORMAT)
         rev1 = project.commit("Commit 1")
 
@@ -850,7 +918,7 @@ class ProjectTest(TestCase):
     @scoped
     def test_can_add_plugin(self):
         test_dir = scope_add(TestDir())
-        scope_add(Project.init(test_dir)).close()
+        scope_add(init_test_project(test_dir)).close()
 
         plugin_dir = osp.join(test_dir, '.datumaro', 'plugins')
         os.makedirs(plugin_dir)
@@ -888,7 +956,7 @@ class ProjectTest(TestCase):
 
         test_dir = scope_add(TestDir())
         extractor_name = 'ext1'
-        project = scope_add(Project.init(test_dir))
+        project = scope_add(init_test_project(test_dir))
         project.env.extractors.register(extractor_name, CustomExtractor)
         project.import_source('src1', url='', format=extractor_name)
         dataset = project.working_tree.make_dataset()
@@ -912,7 +980,7 @@ class ProjectTest(TestCase):
         ]).save(dataset_url)
 
         proj_dir = osp.join(test_dir, 'proj')
-        with Project.init(proj_dir) as project:
+        with init_test_project(proj_dir) as project:
             project.import_source('source1', url=dataset_url,
                 format=DEFAULT_FORMAT)
             project.commit('first commit')
@@ -961,7 +1029,7 @@ class ProjectTest(TestCase):
         dataset.save(dataset_url)
 
         proj_dir = osp.join(test_dir, 'proj')
-        project = scope_add(Project.init(proj_dir))
+        project = scope_add(init_test_project(proj_dir))
         project.import_source('source1', url=dataset_url,
             format=DEFAULT_FORMAT, no_hash=True)
 
@@ -980,7 +1048,7 @@ class ProjectTest(TestCase):
         ]).save(dataset_url)
 
         proj_dir = osp.join(test_dir, 'proj')
-        project = scope_add(Project.init(proj_dir))
+        project = scope_add(init_test_project(proj_dir))
         project.import_source('source1', url=dataset_url,
             format=DEFAULT_FORMAT, no_hash=True)
         project.import_source('source2', url=dataset_url,
@@ -1003,7 +1071,7 @@ class ProjectTest(TestCase):
         ]).save(dataset_url)
 
         proj_dir = osp.join(test_dir, 'proj')
-        project = scope_add(Project.init(proj_dir))
+        project = scope_add(init_test_project(proj_dir))
         project.import_source('source1', url=dataset_url,
             format=DEFAULT_FORMAT, no_hash=True)
         project.commit('a commit')